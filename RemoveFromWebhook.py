@@ -2,10 +2,8 @@ from flask import Flask, request, jsonify
 import os
 from dotenv import load_dotenv
 import logging
-from plexapi.myplex import MyPlexAccount
 import json
 import sys
-from plexapi.server import PlexServer
 
 logging.basicConfig(
     level=logging.INFO,
@@ -17,6 +15,9 @@ load_dotenv()
 app = Flask(__name__)
 
 def remove_from_watchlist(plex_id: str):
+    # import différé : plexapi n'est chargé qu'au premier webhook à traiter
+    from plexapi.myplex import MyPlexAccount
+
     username = os.getenv('PLEX_USERNAME')
     password = os.getenv('PLEX_PASSWORD')
 
@@ -64,6 +65,7 @@ def remove_from_watchlist_for_all(plex_id: str):
     pour chaque utilisateur listé dans USER_CREDENTIALS.
     USER_CREDENTIALS est une liste de dicts : {"username": "...", "password": "..."}
     """
+    from plexapi.myplex import MyPlexAccount
 
     # 1) Charger la liste des comptes (admin + amis)
     credentials = [
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark du démarrage à froid des points d'entrée.
+
+Chaque module est importé dans un interpréteur neuf (comme un lancement cron)
+et on mesure le temps d'import et la mémoire max (RSS) du processus.
+
+Usage : python bench_startup.py [nb_runs]
+"""
+
+import os
+import subprocess
+import sys
+
+MODULES = ["sync_core", "sync", "app"]
+
+# exécuté dans le sous-processus : import du module puis temps + RSS max
+PROBE = """\
+import resource, sys, time
+t0 = time.perf_counter()
+__import__(sys.argv[1])
+dt = time.perf_counter() - t0
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(dt, rss, int("plexapi" in sys.modules), int("flask" in sys.modules))
+"""
+
+def measure(module, runs):
+    here = os.path.dirname(os.path.abspath(__file__))
+    times, rss = [], []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE, module],
+            cwd=here, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        times.append(float(out[0]))
+        rss.append(int(out[1]))
+    return min(times), min(rss), out[2] == "1", out[3] == "1"
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'module':<10} {'import (ms)':>12} {'RSS max (Mo)':>13}  plexapi  flask")
+    for module in MODULES:
+        dt, rss, plexapi, flask = measure(module, runs)
+        print(f"{module:<10} {dt * 1000:>12.1f} {rss / 1024:>13.1f}  {'oui' if plexapi else 'non':<7}  {'oui' if flask else 'non'}")
@@ -1,5 +1,9 @@
 # sync.py
-from app import sync_collections_once
+# Point d'entrée cron : n'importe que sync_core (pas de Flask, plexapi différé)
+import logging
+
+from sync_core import sync_collections_once
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     sync_collections_once()
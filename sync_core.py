@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Cœur de la synchro, sans dépendance web :
+ - config (variables d'environnement)
+ - stockage JSON (tokens utilisateurs, token admin, état)
+ - routine de sync des collections (fonction sync_collections_once)
+
+Ce module est importé par sync.py (cron) et par app.py. Il ne doit pas
+importer Flask, et plexapi n'est importé qu'au moment de parler au serveur
+Plex : un lancement court ne paie que ce dont il a besoin.
+"""
+
+import os
+import json
+import time
+import logging
+
+# ------------------------------------------------------------------
+# CONFIG
+# ------------------------------------------------------------------
+TOKENS_FILE    = os.getenv("TOKENS_FILE", "/data/user_tokens.json")
+TOKEN_FILE     = os.getenv("TOKEN_FILE", "/data/plex_token.json")  # admin token cache
+STATE_FILE     = os.getenv("STATE_FILE", "/data/plex_watchlist_state.json")
+
+# TTL config (env: TOKEN_TTL_HOURS) default 24 hours
+TOKEN_TTL = int(os.getenv("TOKEN_TTL_HOURS", "24")) * 3600
+
+# Admin account name if you want to auto-detect ("Tristan.Brn")
+ADMIN_USERNAME = os.getenv("ADMIN_USERNAME")  # si défini, on considérera ce compte comme admin
+PLEX_URL = os.getenv("PLEX_URL", "http://localhost:32400")
+COLLECTIONS = [c.strip() for c in os.getenv("COLLECTIONS", "").split(",") if c.strip()]
+
+# ------------------------------------------------------------------
+# UTILS stockage
+# ------------------------------------------------------------------
+def load_json(path):
+    if os.path.exists(path):
+        try:
+            return json.load(open(path))
+        except Exception:
+            logging.exception("Impossible de lire %s", path)
+    return {}
+
+def save_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    json.dump(data, open(path, "w"), indent=2)
+
+# user tokens helpers
+def load_user_tokens():
+    return load_json(TOKENS_FILE) or {}
+
+def save_user_token(username, token):
+    tokens = load_user_tokens()
+    tokens[username] = token
+    save_json(TOKENS_FILE, tokens)
+    logging.info("Token utilisateur enregistré pour %s", username)
+
+# admin token helpers (cached token used to access PlexServer)
+def cache_admin_token(token):
+    save_json(TOKEN_FILE, {"token": token, "ts": time.time()})
+    logging.info("Token admin mis en cache")
+
+def get_admin_token():
+    # 1) vérifier cache TOKEN_FILE
+    d = load_json(TOKEN_FILE)
+    if d.get("token") and d.get("ts") and (time.time() - d["ts"] < TOKEN_TTL):
+        logging.info("Token admin récupéré depuis le cache.")
+        return d["token"]
+
+    # 2) si ADMIN_USERNAME est défini, vérifier si on a le token dans user_tokens.json
+    if ADMIN_USERNAME:
+        tokens = load_user_tokens()
+        admin_token = tokens.get(ADMIN_USERNAME)
+        if admin_token:
+            logging.info("Token admin récupéré depuis user_tokens.json (admin connecté via onboarding).")
+            # on met en cache pour accélérer les lectures suivantes
+            cache_admin_token(admin_token)
+            return admin_token
+
+    # 3) pas de token admin disponible
+    logging.warning("Aucun token admin disponible en cache ni dans user_tokens.json.")
+    return None
+
+# ------------------------------------------------------------------
+# LOGIQUE de sync
+# ------------------------------------------------------------------
+def list_all_users():
+    tokens = load_user_tokens()
+    if not tokens:
+        logging.warning("Aucun token utilisateur enregistré.")
+    return [{"username": u, "token": t} for u, t in tokens.items()]
+
+def remove_batch(guids):
+    # import différé : plexapi est lourd, on ne le charge que s'il y a du travail
+    from plexapi.myplex import MyPlexAccount
+
+    for user in list_all_users():
+        try:
+            acc = MyPlexAccount(token=user["token"])
+            watchlist = {item.guid: item for item in acc.watchlist()}
+            for g in guids:
+                if g in watchlist:
+                    acc.removeFromWatchlist(watchlist[g])
+                    logging.info("Retiré %s pour %s", watchlist[g].title, user["username"])
+        except Exception as e:
+            logging.exception("Erreur pour %s : %s", user["username"], e)
+
+def sync_collections_once():
+    if not COLLECTIONS:
+        logging.warning("Aucune collection configurée (env COLLECTIONS).")
+        return
+
+    logging.info("Collections à surveiller : %s", ", ".join(COLLECTIONS))
+
+    token = get_admin_token()
+    if not token:
+        logging.error("Pas de token admin disponible — impossible de se connecter au serveur Plex local.")
+        return
+
+    # import différé : inutile de charger plexapi si on sort avant de se connecter
+    from plexapi.server import PlexServer
+
+    server = PlexServer(PLEX_URL, token=token)
+    logging.info("Connecté au serveur Plex local.")
+
+    current = set()
+    for name in COLLECTIONS:
+        found = False
+        for lib in server.library.sections():
+            if lib.type not in {"movie", "show"}:
+                continue
+            try:
+                coll = next(c for c in lib.collections() if c.title == name)
+                nb_items = len(coll.items())
+                logging.info("Collection '%s' trouvée dans %s (%d élément(s))", name, lib.title, nb_items)
+                current.update(item.guid for item in coll.items())
+                found = True
+                break
+            except StopIteration:
+                logging.debug("Collection '%s' absente de la bibliothèque %s", name, lib.title)
+        if not found:
+            logging.warning("Collection '%s' introuvable dans toutes les bibliothèques.", name)
+
+    previous = set(load_json(STATE_FILE) or [])
+    new_guids = current - previous
+
+    logging.info("GUID présents dans les collections : %d", len(current))
+    logging.info("GUID déjà connus : %d", len(previous))
+    logging.info("Nouveaux GUID à retirer : %d", len(new_guids))
+
+    if new_guids:
+        remove_batch(new_guids)
+    else:
+        logging.info("Rien à retirer, watchlist déjà synchronisée.")
+
+    save_json(STATE_FILE, list(current))
+    logging.info("État sauvegardé dans %s", STATE_FILE)